@@ -1,17 +1,7 @@
 """
 Obsidian metadata ingestion for DataHub.
 """
-from .discovery import ObsidianNote, ObsidianVault, find_vaults, get_vault_notes
-from .aspects import (
-    create_datahub_emitter,
-    emit_note_metadata,
-    create_dataset_urn,
-    create_dataset_mcp,
-    create_status_mcp,
-    create_ownership_mcp,
-    create_schema_mcp,
-    create_browse_paths_mcp,
-)
+from .discovery import ObsidianNote, ObsidianVault, find_vaults, get_vault_notes, scan_vaults
 from .cli import main
 
 __all__ = [
@@ -19,8 +9,12 @@ __all__ = [
     "ObsidianVault",
     "find_vaults",
     "get_vault_notes",
+    "scan_vaults",
+    "IngestContext",
     "create_datahub_emitter",
+    "build_note_mcps",
     "emit_note_metadata",
+    "emit_notes_metadata",
     "create_dataset_urn",
     "create_dataset_mcp",
     "create_status_mcp",
@@ -28,4 +22,28 @@ __all__ = [
     "create_schema_mcp",
     "create_browse_paths_mcp",
     "main",
-]
\ No newline at end of file
+]
+
+# Aspect builders pull in the DataHub SDK, which is slow to import; load them
+# on first access (PEP 562) so discovery and --list-only stay lightweight.
+_LAZY_ASPECTS = frozenset({
+    "IngestContext",
+    "create_datahub_emitter",
+    "build_note_mcps",
+    "emit_note_metadata",
+    "emit_notes_metadata",
+    "create_dataset_urn",
+    "create_dataset_mcp",
+    "create_status_mcp",
+    "create_ownership_mcp",
+    "create_schema_mcp",
+    "create_browse_paths_mcp",
+})
+
+
+def __getattr__(name):
+    if name in _LAZY_ASPECTS:
+        from . import aspects
+
+        return getattr(aspects, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
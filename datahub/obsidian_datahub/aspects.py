@@ -4,9 +4,13 @@ DataHub aspect generation and emission.
 from __future__ import annotations
 
 import os
+import re
 import time
+import functools
 import logging
-from typing import Dict, Any, Optional
+import threading
+from dataclasses import dataclass
+from typing import Dict, Any, Iterable, List, Optional, Sequence, Set, Tuple
 
 from datahub.emitter.mcp import MetadataChangeProposalWrapper
 from datahub.emitter.rest_emitter import DatahubRestEmitter
@@ -33,31 +37,63 @@ from datahub.metadata.schema_classes import (
     MapTypeClass,
     NullTypeClass,
     TimeTypeClass,
-    DomainPropertiesClass,
 )
 
 from .discovery import ObsidianNote, ObsidianVault
+from .urns import ALL_ASPECTS, PLATFORM_URN, build_ids
 
 logger = logging.getLogger("obsidian-datahub.aspects")
 
 
+@dataclass(frozen=True)
+class IngestContext:
+    """Per-run values shared by every note, resolved once up front."""
+    user: str
+    owner_urn: str
+    domain_urn: Optional[str]
+    now_ms: int
+
+    @classmethod
+    def from_env(cls) -> "IngestContext":
+        user = os.getenv("USER", "local")
+        return cls(
+            user=user,
+            owner_urn=os.getenv("DATAHUB_OWNER_URN", f"urn:li:corpuser:{user}"),
+            domain_urn=get_domain_urn(),
+            now_ms=int(time.time() * 1000),
+        )
+
+
 def create_datahub_emitter() -> DatahubRestEmitter:
-    """Create a DataHub REST emitter pointed at local quickstart by default."""
+    """Create a DataHub REST emitter pointed at local quickstart by default.
+
+    The emitter's session already pools keep-alive connections to GMS and
+    retries 429/5xx responses, so worker threads can share it as is.
+    """
     gms = os.getenv("DATAHUB_GMS", "http://localhost:8080")
     logger.info("Using DataHub GMS at %s", gms)
     return DatahubRestEmitter(gms_server=gms, token=os.getenv("DATAHUB_TOKEN", ""))
 
 
-def ensure_domain_exists(emitter: DatahubRestEmitter) -> None:
-    """Create the domain in DataHub if it doesn't exist."""
+# Domains already created by this process; ensure_domain_exists is a no-op for these.
+_domains_ensured: set[str] = set()
+_domains_lock = threading.Lock()
+
+
+def ensure_domain_exists(emitter: DatahubRestEmitter, domain_urn: Optional[str] = None) -> None:
+    """Create the domain in DataHub if it doesn't exist (at most once per process)."""
     from datahub.metadata.schema_classes import (
         DomainPropertiesClass,
         DomainKeyClass,
     )
 
-    domain_urn = get_domain_urn()
+    if domain_urn is None:
+        domain_urn = get_domain_urn()
     if not domain_urn:
         return
+    with _domains_lock:
+        if domain_urn in _domains_ensured:
+            return
 
     domain_name = domain_urn.split(":")[-1]  # Get name from urn:li:domain:name
     logger.info("Ensuring domain exists: %s", domain_name)
@@ -87,13 +123,16 @@ def ensure_domain_exists(emitter: DatahubRestEmitter) -> None:
     try:
         emitter.emit(key_mcp)
         emitter.emit(props_mcp)
+        with _domains_lock:
+            _domains_ensured.add(domain_urn)
         logger.info("Domain created/updated successfully: %s", domain_name)
     except Exception as e:
         logger.warning("Failed to create domain %s: %s", domain_name, e)
 
 
+@functools.lru_cache(maxsize=1)
 def get_domain_urn() -> Optional[str]:
-    """Get the DataHub domain URN from environment variable."""
+    """Get the DataHub domain URN from environment variable (read once per process)."""
     domain_urn = os.getenv("DATAHUB_DOMAIN_URN")
     if domain_urn and not domain_urn.startswith("urn:li:domain:"):
         # If only domain name is provided, construct the full URN
@@ -101,41 +140,53 @@ def get_domain_urn() -> Optional[str]:
     return domain_urn
 
 
-def create_domain_mcp(dataset_urn: str) -> Optional[MetadataChangeProposalWrapper]:
-    """Create a domain aspect for a dataset if DATAHUB_DOMAIN_URN is set."""
+def default_context() -> IngestContext:
+    """IngestContext used when callers pass none.
+
+    Resolved on every call, not cached, so a long-lived process does not
+    reuse a stale timestamp; chunk-level callers resolve it once per chunk.
+    """
+    return IngestContext.from_env()
+
+
+@functools.lru_cache(maxsize=8)
+def _domains_aspect(domain_urn: str) -> Any:
+    """Shared DomainsClass aspect for a domain; only the wrapping MCP varies per dataset."""
     from datahub.metadata.schema_classes import DomainsClass
-    
-    domain_urn = get_domain_urn()
+
+    return DomainsClass(domains=[domain_urn])
+
+
+def create_domain_mcp(dataset_urn: str, domain_urn: Optional[str] = None) -> Optional[MetadataChangeProposalWrapper]:
+    """Create a domain aspect for a dataset if DATAHUB_DOMAIN_URN is set."""
+    if domain_urn is None:
+        domain_urn = get_domain_urn()
     if not domain_urn:
         return None
 
-    domains_aspect = DomainsClass(
-        domains=[domain_urn]
-    )
-
     return MetadataChangeProposalWrapper(
         entityType="dataset",
         entityUrn=dataset_urn,
         aspectName="domains",
-        aspect=domains_aspect,
+        aspect=_domains_aspect(domain_urn),
     )
 
 
 def create_dataset_urn(vault: ObsidianVault, note: ObsidianNote) -> str:
     """Create a DataHub dataset URN for a note."""
-    safe_vault = vault.name.replace(" ", "_")
-    safe_note = note.name.replace(" ", "_")
-    dataset_name = f"obsidian.{safe_vault}.{safe_note}"
-    return f"urn:li:dataset:(urn:li:dataPlatform:obsidian,{dataset_name},PROD)"
+    return build_ids(vault.name, note.name)[3]
 
 
-def create_dataset_mcp(note: ObsidianNote, vault: ObsidianVault) -> MetadataChangeProposalWrapper:
+def create_dataset_mcp(
+    note: ObsidianNote,
+    vault: ObsidianVault,
+    ctx: Optional[IngestContext] = None,
+) -> MetadataChangeProposalWrapper:
     """Create a MetadataChangeProposalWrapper for a single note as a dataset (properties aspect)."""
-    # dataset name should be safe for urn; replace spaces with underscores
-    safe_vault = vault.name.replace(" ", "_")
-    safe_note = note.name.replace(" ", "_")
-    dataset_name = f"obsidian.{safe_vault}.{safe_note}"
-    dataset_urn = f"urn:li:dataset:(urn:li:dataPlatform:obsidian,{dataset_name},PROD)"
+    if ctx is None:
+        ctx = default_context()
+    dataset_name = note.dataset_name
+    dataset_urn = note.dataset_urn
 
     # DatasetProperties - used by DataHub UI for display
     props = DatasetPropertiesClass(
@@ -146,10 +197,10 @@ def create_dataset_mcp(note: ObsidianNote, vault: ObsidianVault) -> MetadataChan
             "vault_path": str(vault.path),
             "note_path": str(note.relative_path),
             "size_bytes": str(note.size),
-            "last_modified": note.modified_time.isoformat(),
+            "last_modified": note.modified_time_iso,
             # qualifiedName is important for many integrations/search UIs
-            "qualifiedName": f"{dataset_name}@{os.getenv('USER', 'local')}"
-            ,"owners": os.getenv('DATAHUB_OWNER_URN', f"urn:li:corpuser:{os.getenv('USER', 'local')}")
+            "qualifiedName": f"{dataset_name}@{ctx.user}",
+            "owners": ctx.owner_urn,
         },
     )
 
@@ -163,28 +214,28 @@ def create_dataset_mcp(note: ObsidianNote, vault: ObsidianVault) -> MetadataChan
 
 def create_status_mcp(dataset_urn: str) -> MetadataChangeProposalWrapper:
     """Create a simple status aspect to mark the dataset as not removed (visible)."""
-    status_aspect = StatusClass(removed=False)
     return MetadataChangeProposalWrapper(
         entityType="dataset",
         entityUrn=dataset_urn,
         aspectName="status",
-        aspect=status_aspect,
+        aspect=_STATUS_NOT_REMOVED,
     )
 
 
-def create_ownership_mcp(dataset_urn: str) -> MetadataChangeProposalWrapper:
+def create_ownership_mcp(dataset_urn: str, ctx: Optional[IngestContext] = None) -> MetadataChangeProposalWrapper:
     """Create a minimal ownership aspect pointing to the current user as DATAOWNER."""
-    user = os.getenv("DATAHUB_OWNER_URN", f"urn:li:corpuser:{os.getenv('USER', 'local')}")
+    if ctx is None:
+        ctx = default_context()
+    user = ctx.owner_urn
     # Use SDK-provided ownership enums/structs so the emitted object matches writer schema
     owner = OwnerClass(
         owner=user,
         type=OwnershipTypeClass.DATAOWNER,
         source=OwnershipSourceClass(type=OwnershipSourceTypeClass.MANUAL),
     )
-    # Provide a proper lastModified AuditStamp (time in milliseconds) to satisfy schema
-    now_ms = int(time.time() * 1000)
-    actor = user
-    last_modified = AuditStampClass(time=now_ms, actor=actor)
+    # Provide a proper lastModified AuditStamp (time in milliseconds) to satisfy schema;
+    # one stamp per ingest run is enough for lastModified
+    last_modified = AuditStampClass(time=ctx.now_ms, actor=user)
     # Some DataHub SDK versions expect ownerTypes to be nullable; use None instead of an empty map
     ownership_aspect = OwnershipClass(owners=[owner], ownerTypes=None, lastModified=last_modified)
     return MetadataChangeProposalWrapper(
@@ -195,41 +246,87 @@ def create_ownership_mcp(dataset_urn: str) -> MetadataChangeProposalWrapper:
     )
 
 
+# Aspect values that are identical for every note are built once and shared
+# between MCPs; they are never mutated after construction.
+_STATUS_NOT_REMOVED = StatusClass(removed=False)
+_SCHEMALESS = SchemalessClass()
+_STRING_T = StringTypeClass()
+_BOOLEAN_T = BooleanTypeClass()
+_DATE_T = DateTypeClass()
+_TIME_T = TimeTypeClass()
+_NUMBER_T = NumberTypeClass()
+_BYTES_T = BytesTypeClass()
+_ARRAY_T = ArrayTypeClass()
+_MAP_T = MapTypeClass()
+_NULL_T = NullTypeClass()
+
+
+# Common native type names resolve with a single dict lookup.
+_EXACT_TYPES = {
+    "string": _STRING_T,
+    "str": _STRING_T,
+    "text": _STRING_T,
+    "boolean": _BOOLEAN_T,
+    "bool": _BOOLEAN_T,
+    "timestamp": _DATE_T,
+    "datetime": _DATE_T,
+    "date": _DATE_T,
+    "time": _TIME_T,
+    "int": _NUMBER_T,
+    "integer": _NUMBER_T,
+    "long": _NUMBER_T,
+    "float": _NUMBER_T,
+    "double": _NUMBER_T,
+    "number": _NUMBER_T,
+    "bytes": _BYTES_T,
+    "array": _ARRAY_T,
+    "list": _ARRAY_T,
+    "map": _MAP_T,
+    "json": _MAP_T,
+    "object": _MAP_T,
+    "null": _NULL_T,
+}
+
+# Anything else is classified by substring. Alternatives are tried in order
+# at position 0, so earlier categories win (e.g. "array<int>" is a number).
+_TYPE_RE = re.compile(
+    r"(?=.*bool)(?P<boolean>)"
+    r"|(?=.*(?:date|timestamp|iso8601))(?P<date>)"
+    r"|time\Z(?P<time>)"
+    r"|(?=.*(?:int|long|number|float|double))(?P<number>)"
+    r"|(?=.*(?:byte|blob))(?P<bytes>)"
+    r"|(?=.*(?:array|list))(?P<array>)"
+    r"|(?=.*(?:map|json|object|struct))(?P<map>)"
+    r"|(?=.*(?:null|none|optional))(?P<null>)",
+    re.DOTALL,
+)
+_TYPE_BY_GROUP = {
+    "boolean": _BOOLEAN_T,
+    "date": _DATE_T,
+    "time": _TIME_T,
+    "number": _NUMBER_T,
+    "bytes": _BYTES_T,
+    "array": _ARRAY_T,
+    "map": _MAP_T,
+    "null": _NULL_T,
+}
+
+
 def map_native_to_type(native: str) -> Any:
     """Map a native data type string to a DataHub SchemaFieldDataType."""
     if not native:
-        return StringTypeClass()
+        return _STRING_T
     n = native.lower()
-    # boolean
-    if any(tok in n for tok in ("bool", "boolean")):
-        return BooleanTypeClass()
-    # date / timestamp
-    if any(tok in n for tok in ("timestamp", "datetime", "date", "iso8601")):
-        return DateTypeClass()
-    # time
-    if "time" == n:
-        return TimeTypeClass()
-    # integer / number
-    if any(tok in n for tok in ("int", "integer", "long", "bigint", "number", "float", "double")):
-        return NumberTypeClass()
-    # bytes
-    if "byte" in n or "blob" in n:
-        return BytesTypeClass()
-    # array / list
-    if any(tok in n for tok in ("array", "list")):
-        return ArrayTypeClass()
-    # map / json / object
-    if any(tok in n for tok in ("map", "json", "object", "struct")):
-        return MapTypeClass()
-    # null / unknown
-    if any(tok in n for tok in ("null", "none", "nullable", "optional")):
-        return NullTypeClass()
+    exact = _EXACT_TYPES.get(n)
+    if exact is not None:
+        return exact
+    m = _TYPE_RE.match(n)
     # fallback to string
-    return StringTypeClass()
+    return _TYPE_BY_GROUP[m.lastgroup] if m else _STRING_T
 
 
-def create_schema_mcp(note: ObsidianNote, vault: ObsidianVault, dataset_name: str, dataset_urn: str) -> MetadataChangeProposalWrapper:
-    """Create a lightweight schemaMetadata aspect describing available fields."""
+def _build_schema_fields() -> List[SchemaFieldClass]:
+    """Build the fixed field list shared by every note's schemaMetadata."""
     # Provide a small schema with common fields so DataHub can render a schema panel.
     # field dictionaries follow the DataHub JSON shape for SchemaField (fieldPath, nativeDataType, description)
     fields = [
@@ -267,15 +364,22 @@ def create_schema_mcp(note: ObsidianNote, vault: ObsidianVault, dataset_name: st
             description=f.get("description", ""),
         )
         schema_fields.append(sf)
+    return schema_fields
+
 
+_DEFAULT_SCHEMA_FIELDS = _build_schema_fields()
+
+
+def create_schema_mcp(note: ObsidianNote, vault: ObsidianVault, dataset_name: str, dataset_urn: str) -> MetadataChangeProposalWrapper:
+    """Create a lightweight schemaMetadata aspect describing available fields."""
     # SchemaMetadataClass expects: schemaName, platform, version, hash, platformSchema, fields
     schema_aspect = SchemaMetadataClass(
         schemaName=dataset_name,
-        platform="urn:li:dataPlatform:obsidian",
+        platform=PLATFORM_URN,
         version=0,
         hash="",
-        platformSchema=SchemalessClass(),
-        fields=schema_fields,
+        platformSchema=_SCHEMALESS,
+        fields=_DEFAULT_SCHEMA_FIELDS,
     )
 
     return MetadataChangeProposalWrapper(
@@ -288,7 +392,7 @@ def create_schema_mcp(note: ObsidianNote, vault: ObsidianVault, dataset_name: st
 
 def create_browse_paths_mcp(dataset_urn: str, vault: ObsidianVault, note: ObsidianNote) -> MetadataChangeProposalWrapper:
     """Create browsePaths aspect for UI navigation."""
-    browse_path = f"obsidian/{vault.name}/{note.relative_path}"
+    browse_path = vault.browse_prefix + "/" + note.relative_path
     bp = BrowsePathsClass(paths=[browse_path])
     return MetadataChangeProposalWrapper(
         entityType="dataset",
@@ -298,74 +402,176 @@ def create_browse_paths_mcp(dataset_urn: str, vault: ObsidianVault, note: Obsidi
     )
 
 
-def emit_note_metadata(
-    emitter: DatahubRestEmitter,
+# Aspects whose failure aborts the note; the rest are emitted best-effort.
+_REQUIRED_ASPECTS = ("datasetProperties", "status")
+
+# Notes per emission chunk; each chunk is sent as two batched requests.
+NOTE_BATCH_SIZE = 100
+
+
+def emit_mcps(emitter: DatahubRestEmitter, mcps: List[MetadataChangeProposalWrapper]) -> None:
+    """Emit a list of MCPs in a single request when the SDK supports it."""
+    if hasattr(emitter, "emit_mcps"):
+        emitter.emit_mcps(mcps)
+    else:
+        for mcp in mcps:
+            emitter.emit(mcp)
+
+
+def build_note_mcps(
     note: ObsidianNote,
     vault: ObsidianVault,
     aspects: Optional[list[str]] = None,
-) -> None:
-    """Emit metadata for a single note."""
+    ctx: Optional[IngestContext] = None,
+) -> tuple[str, List[MetadataChangeProposalWrapper]]:
+    """Build the selected MCPs for a note; returns (dataset_urn, mcps)."""
     if aspects is None:
-        aspects = ["properties", "status", "ownership", "schema", "browse", "domain"]
-        
-    # Ensure domain exists if we're going to use it
-    if "domain" in aspects and get_domain_urn():
-        ensure_domain_exists(emitter)
-
-    # build identifiers
-    safe_vault = vault.name.replace(" ", "_")
-    safe_note = note.name.replace(" ", "_")
-    dataset_name = f"obsidian.{safe_vault}.{safe_note}"
-    dataset_urn = f"urn:li:dataset:(urn:li:dataPlatform:obsidian,{dataset_name},PROD)"
-
-    # emit dataset properties (display)
+        aspects = ALL_ASPECTS
+    if ctx is None:
+        ctx = default_context()
+
+    # identifiers are computed once when the note is discovered
+    dataset_name = note.dataset_name
+    dataset_urn = note.dataset_urn
+
+    mcps: List[MetadataChangeProposalWrapper] = []
+
+    # dataset properties (display)
     if "properties" in aspects:
-        mcp_props = create_dataset_mcp(note, vault)
-        logger.info("Emitting datasetProperties for %s", dataset_urn)
-        emitter.emit(mcp_props)
+        mcps.append(create_dataset_mcp(note, vault, ctx))
 
-    # emit status (makes it visible in UI)
+    # status (makes it visible in UI)
     if "status" in aspects:
-        mcp_status = create_status_mcp(dataset_urn)
-        logger.info("Emitting status for %s", dataset_urn)
-        emitter.emit(mcp_status)
+        mcps.append(create_status_mcp(dataset_urn))
 
-    # emit ownership (so dataset shows owners panel)
+    # ownership (so dataset shows owners panel)
     if "ownership" in aspects:
-        mcp_own = create_ownership_mcp(dataset_urn)
-        logger.info("Emitting ownership for %s", dataset_urn)
-        try:
-            emitter.emit(mcp_own)
-        except Exception as e:
-            logger.warning("Emitting ownership failed for %s: %s -- continuing without ownership aspect", dataset_urn, e)
+        mcps.append(create_ownership_mcp(dataset_urn, ctx))
 
-    # emit schema metadata (so dataset shows schema panel)
+    # schema metadata (so dataset shows schema panel)
     if "schema" in aspects:
         try:
-            mcp_schema = create_schema_mcp(note, vault, dataset_name, dataset_urn)
-            logger.info("Emitting schemaMetadata for %s", dataset_urn)
-            emitter.emit(mcp_schema)
+            mcps.append(create_schema_mcp(note, vault, dataset_name, dataset_urn))
         except Exception as e:
-            logger.warning("Emitting schemaMetadata failed for %s: %s -- continuing without schema", dataset_urn, e)
+            logger.warning("Building schemaMetadata failed for %s: %s -- continuing without schema", dataset_urn, e)
 
-    # emit browsePaths so dataset appears in browse UI
+    # browsePaths so dataset appears in browse UI
     if "browse" in aspects:
         try:
-            mcp_bp = create_browse_paths_mcp(dataset_urn, vault, note)
-            logger.info("Emitting browsePaths for %s -> %s", dataset_urn, f"obsidian/{vault.name}/{note.relative_path}")
-            emitter.emit(mcp_bp)
+            mcps.append(create_browse_paths_mcp(dataset_urn, vault, note))
         except Exception:
             # non-fatal
-            logger.debug("browsePaths emission failed for %s", dataset_urn, exc_info=True)
+            logger.debug("browsePaths creation failed for %s", dataset_urn, exc_info=True)
 
-    # emit domains (assign dataset to a DataHub domain) if configured
+    # domains (assign dataset to a DataHub domain) if configured
     if "domain" in aspects:
         try:
-            mcp_domain = create_domain_mcp(dataset_urn)
+            mcp_domain = create_domain_mcp(dataset_urn, ctx.domain_urn) if ctx.domain_urn else None
             if mcp_domain:
-                logger.info("Emitting domains for %s", dataset_urn)
-                emitter.emit(mcp_domain)
+                mcps.append(mcp_domain)
         except Exception as e:
-            logger.warning("Emitting domains failed for %s: %s -- continuing without domains", dataset_urn, e)
+            logger.warning("Building domains failed for %s: %s -- continuing without domains", dataset_urn, e)
+
+    return dataset_urn, mcps
+
 
-    logger.info("Emit OK: %s", dataset_urn)
\ No newline at end of file
+def log_batch_failure(count: int, required: bool, error: Exception) -> None:
+    logger.warning(
+        "Batch emit of %d %s aspect(s) failed: %s -- retrying individually",
+        count, "required" if required else "optional", error,
+    )
+
+
+def record_aspect_failure(
+    mcp: MetadataChangeProposalWrapper, error: Exception, required: bool, failed: Set[str]
+) -> None:
+    """Handle an aspect that failed on its own: re-raise if required, else log it and add its URN to `failed`."""
+    if required:
+        raise error
+    logger.warning("Emitting %s failed for %s: %s -- continuing without it", mcp.aspectName, mcp.entityUrn, error)
+    failed.add(mcp.entityUrn)
+
+
+def _emit_with_fallback(emitter: DatahubRestEmitter, mcps: List[MetadataChangeProposalWrapper], required: bool) -> Set[str]:
+    """Emit `mcps` as one batch, retrying them one by one if the batch is rejected.
+
+    Individual failures are handled by `record_aspect_failure`; returns the
+    entity URNs whose best-effort aspects failed.
+    """
+    failed: Set[str] = set()
+    try:
+        emit_mcps(emitter, mcps)
+    except Exception as e:
+        log_batch_failure(len(mcps), required, e)
+        for mcp in mcps:
+            try:
+                emitter.emit(mcp)
+            except Exception as e:
+                record_aspect_failure(mcp, e, required, failed)
+    return failed
+
+
+def split_required(
+    mcps: Iterable[MetadataChangeProposalWrapper],
+) -> Tuple[List[MetadataChangeProposalWrapper], List[MetadataChangeProposalWrapper]]:
+    """Split MCPs into (required, best-effort) lists, preserving order."""
+    required: List[MetadataChangeProposalWrapper] = []
+    optional: List[MetadataChangeProposalWrapper] = []
+    for mcp in mcps:
+        (required if mcp.aspectName in _REQUIRED_ASPECTS else optional).append(mcp)
+    return required, optional
+
+
+def build_chunk_mcps(
+    pairs: Sequence[Tuple[ObsidianVault, ObsidianNote]],
+    aspects: Optional[list[str]] = None,
+    ctx: Optional[IngestContext] = None,
+) -> Tuple[List[MetadataChangeProposalWrapper], List[MetadataChangeProposalWrapper]]:
+    """Build the MCPs of a chunk of notes, split into (required, best-effort)."""
+    if ctx is None:
+        ctx = default_context()
+    mcps: List[MetadataChangeProposalWrapper] = []
+    for vault, note in pairs:
+        dataset_urn, note_mcps = build_note_mcps(note, vault, aspects, ctx)
+        # per-note logs are DEBUG; ingest_vaults logs progress at INFO
+        if note_mcps and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Emitting %s for %s", ", ".join(mcp.aspectName for mcp in note_mcps), dataset_urn)
+        mcps.extend(note_mcps)
+    return split_required(mcps)
+
+
+def emit_notes_metadata(
+    emitter: DatahubRestEmitter,
+    pairs: Sequence[Tuple[ObsidianVault, ObsidianNote]],
+    aspects: Optional[list[str]] = None,
+    ctx: Optional[IngestContext] = None,
+) -> Set[str]:
+    """Emit metadata for a chunk of (vault, note) pairs.
+
+    The aspects of all notes are sent in two batches: the required aspects
+    first, then the best-effort ones. If a batch is rejected its aspects are
+    retried one by one, so a single bad optional aspect does not drop the
+    others. Returns the dataset URNs with a failed best-effort aspect. The
+    domain itself is not created here; callers run `ensure_domain_exists`
+    once before emitting notes.
+    """
+    required, optional = build_chunk_mcps(pairs, aspects, ctx)
+    failed: Set[str] = set()
+    if required:
+        _emit_with_fallback(emitter, required, required=True)
+    if optional:
+        failed = _emit_with_fallback(emitter, optional, required=False)
+
+    logger.debug("Emit OK: %d note(s)", len(pairs))
+    return failed
+
+
+def emit_note_metadata(
+    emitter: DatahubRestEmitter,
+    note: ObsidianNote,
+    vault: ObsidianVault,
+    aspects: Optional[list[str]] = None,
+    ctx: Optional[IngestContext] = None,
+) -> Set[str]:
+    """Emit metadata for a single note; see `emit_notes_metadata`."""
+    return emit_notes_metadata(emitter, [(vault, note)], aspects, ctx)
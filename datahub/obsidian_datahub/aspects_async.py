@@ -0,0 +1,199 @@
+"""
+Asynchronous DataHub emission over aiohttp.
+
+Posts the same MCPs as `emit_notes_metadata`, but drives all note chunks from one
+event loop with a bounded number of in-flight requests instead of blocking a
+thread per request.
+"""
+from __future__ import annotations
+
+import os
+import json
+import asyncio
+import logging
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+import aiohttp
+from datahub.emitter.mcp import MetadataChangeProposalWrapper
+from datahub.emitter.serialization_helper import pre_json_transform
+
+from .aspects import (
+    NOTE_BATCH_SIZE,
+    IngestContext,
+    build_chunk_mcps,
+    log_batch_failure,
+    record_aspect_failure,
+)
+from .discovery import ObsidianNote, ObsidianVault
+
+logger = logging.getLogger("obsidian-datahub.aspects_async")
+
+DEFAULT_CONCURRENCY = 32
+
+# Responses retried with exponential backoff (0.5s, 1s, 2s) before giving up.
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+_MAX_RETRIES = 3
+_BACKOFF_S = 0.5
+
+# Same limits as the SDK's DatahubRestEmitter.emit_mcps: GMS rejects larger
+# ingestProposalBatch requests.
+_MAX_BATCH_PROPOSALS = int(os.getenv("DATAHUB_REST_EMITTER_BATCH_MAX_PAYLOAD_LENGTH", "200"))
+_MAX_BATCH_BYTES = 15 * 1024 * 1024
+
+
+def _headers() -> dict:
+    headers = {
+        "Content-Type": "application/json",
+        "X-RestLi-Protocol-Version": "2.0.0",
+    }
+    token = os.getenv("DATAHUB_TOKEN", "")
+    if token:
+        headers["Authorization"] = f"Bearer {token}"
+    return headers
+
+
+# Aspects whose instance is shared by every note (see _STATUS_NOT_REMOVED and
+# _domains_aspect): their proposals differ only in entityUrn, so each is
+# serialized once and copied with the URN swapped in.
+_SHARED_ASPECT_NAMES = frozenset({"status", "domains"})
+_proposal_templates: Dict[int, Tuple[Any, dict]] = {}
+
+
+def _proposal(mcp: MetadataChangeProposalWrapper) -> dict:
+    if mcp.aspectName not in _SHARED_ASPECT_NAMES:
+        return pre_json_transform(mcp.to_obj())
+    # keep a reference to the aspect so its id cannot be reused by another object
+    cached = _proposal_templates.get(id(mcp.aspect))
+    if cached is None or cached[0] is not mcp.aspect:
+        cached = (mcp.aspect, pre_json_transform(mcp.to_obj()))
+        _proposal_templates[id(mcp.aspect)] = cached
+    proposal = dict(cached[1])
+    proposal["entityUrn"] = mcp.entityUrn
+    return proposal
+
+
+async def _post(session: aiohttp.ClientSession, url: str, data: str) -> None:
+    for attempt in range(_MAX_RETRIES + 1):
+        try:
+            async with session.post(url, data=data) as resp:
+                if resp.status < 400:
+                    return
+                body = await resp.text()
+                error = RuntimeError(f"HTTP {resp.status} from {url}: {body[:500]}")
+                if resp.status not in _RETRY_STATUSES:
+                    raise error
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+            error = e
+        if attempt == _MAX_RETRIES:
+            raise error
+        delay = _BACKOFF_S * 2 ** attempt
+        logger.debug("POST %s failed (%s); retrying in %.1fs", url, error, delay)
+        await asyncio.sleep(delay)
+
+
+def _batch_bounds(bodies: Sequence[str]) -> Iterator[Tuple[int, int]]:
+    """Yield (start, end) ranges of `bodies` within the proposal count and payload size caps."""
+    start = size = 0
+    for i, body in enumerate(bodies):
+        # json.dumps escapes non-ASCII, so the length is the encoded size; +2 for the separator
+        length = len(body) + 2
+        if i > start and (i - start >= _MAX_BATCH_PROPOSALS or size + length > _MAX_BATCH_BYTES):
+            yield start, i
+            start, size = i, 0
+        size += length
+    if start < len(bodies):
+        yield start, len(bodies)
+
+
+async def _post_with_fallback(
+    session: aiohttp.ClientSession,
+    gms: str,
+    mcps: List[MetadataChangeProposalWrapper],
+    required: bool,
+) -> Set[str]:
+    """Post `mcps` in capped batches, falling back to one by one; returns URNs of failed best-effort aspects."""
+    failed: Set[str] = set()
+    # serialize once; the batches and the one-by-one fallback reuse the same JSON
+    bodies = [json.dumps(_proposal(mcp)) for mcp in mcps]
+    for start, end in _batch_bounds(bodies):
+        try:
+            await _post(
+                session, f"{gms}/aspects?action=ingestProposalBatch", '{"proposals": [' + ", ".join(bodies[start:end]) + "]}"
+            )
+        except Exception as e:
+            log_batch_failure(end - start, required, e)
+            for mcp, body in zip(mcps[start:end], bodies[start:end]):
+                try:
+                    await _post(session, f"{gms}/aspects?action=ingestProposal", '{"proposal": ' + body + "}")
+                except Exception as e:
+                    record_aspect_failure(mcp, e, required, failed)
+    return failed
+
+
+async def emit_notes_async(
+    session: aiohttp.ClientSession,
+    gms: str,
+    semaphore: asyncio.Semaphore,
+    pairs: Sequence[Tuple[ObsidianVault, ObsidianNote]],
+    aspects: Optional[List[str]],
+    ctx: IngestContext,
+) -> Set[str]:
+    """Emit a chunk of notes as ingestProposalBatch requests.
+
+    Required aspects are sent first, then the best-effort ones, each in
+    batches capped like the SDK's and with the same one-by-one fallback as
+    the synchronous `emit_notes_metadata`. Returns the dataset URNs with a
+    failed best-effort aspect.
+    """
+    failed: Set[str] = set()
+    # build inside the semaphore so only `concurrency` chunks hold their MCPs at once
+    async with semaphore:
+        required, optional = build_chunk_mcps(pairs, aspects, ctx)
+        if required:
+            await _post_with_fallback(session, gms, required, required=True)
+        if optional:
+            failed = await _post_with_fallback(session, gms, optional, required=False)
+
+    logger.debug("Emit OK: %d note(s)", len(pairs))
+    return failed
+
+
+async def _ingest_notes(
+    chunks: Iterable[Sequence[Tuple[ObsidianVault, ObsidianNote]]],
+    aspects: Optional[List[str]],
+    ctx: IngestContext,
+    concurrency: int,
+    on_done: Optional[Callable[[ObsidianVault, ObsidianNote, bool], None]],
+) -> None:
+    gms = os.getenv("DATAHUB_GMS", "http://localhost:8080").rstrip("/")
+    logger.info("Using DataHub GMS at %s (async, %d in flight)", gms, concurrency)
+    semaphore = asyncio.Semaphore(concurrency)
+    connector = aiohttp.TCPConnector(limit=concurrency, limit_per_host=concurrency, keepalive_timeout=60)
+    async with aiohttp.ClientSession(connector=connector, headers=_headers()) as session:
+
+        async def emit_chunk(chunk: Sequence[Tuple[ObsidianVault, ObsidianNote]]) -> None:
+            failed = await emit_notes_async(session, gms, semaphore, chunk, aspects, ctx)
+            if on_done is not None:
+                for vault, note in chunk:
+                    on_done(vault, note, note.dataset_urn not in failed)
+
+        await asyncio.gather(*[emit_chunk(chunk) for chunk in chunks])
+
+
+def ingest_notes_async(
+    pairs: Iterable[Tuple[ObsidianVault, ObsidianNote]],
+    aspects: Optional[List[str]],
+    ctx: IngestContext,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    on_done: Optional[Callable[[ObsidianVault, ObsidianNote, bool], None]] = None,
+) -> None:
+    """Emit metadata for (vault, note) pairs concurrently; blocks until done.
+
+    Pairs are sent in chunks of NOTE_BATCH_SIZE notes, at most `concurrency`
+    chunks in flight. `on_done(vault, note, complete)` is called on the
+    calling thread for each note once its chunk has been emitted; `complete`
+    is False when one of the note's best-effort aspects failed.
+    """
+    pairs = list(pairs)
+    chunks = [pairs[i:i + NOTE_BATCH_SIZE] for i in range(0, len(pairs), NOTE_BATCH_SIZE)]
+    asyncio.run(_ingest_notes(chunks, aspects, ctx, max(1, concurrency), on_done))
@@ -4,64 +4,106 @@ Main CLI entry point for Obsidian-DataHub integration.
 from __future__ import annotations
 
 import os
+import sys
 import time
 import logging
 import argparse
-from typing import List, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Optional, Set
 
 from .discovery import (
-    find_vaults,
-    get_vault_notes,
+    scan_vaults,
+    ObsidianNote,
     ObsidianVault,
     format_vault_info,
     format_note_info,
 )
-from .aspects import create_datahub_emitter, emit_note_metadata, ensure_domain_exists
+from .state import StateStore, note_fingerprint
+from .urns import ALL_ASPECTS
 
 logger = logging.getLogger("obsidian-datahub")
 
+DEFAULT_WORKERS = 16
+
+# Log an INFO progress line every this many emitted notes.
+_PROGRESS_EVERY = 1000
+
+
+class _RateLimiter:
+    """Space out task starts by at least `interval_s` across all worker threads."""
+
+    def __init__(self, interval_s: float):
+        self._interval = interval_s
+        self._lock = threading.Lock()
+        self._next = 0.0
+
+    def wait(self) -> None:
+        if self._interval <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            delay = self._next - now
+            self._next = max(now, self._next) + self._interval
+        if delay > 0:
+            time.sleep(delay)
+
 
 def discover_vaults(vault_path: Optional[str] = None) -> List[ObsidianVault]:
     """Find Obsidian vaults and their notes."""
     if vault_path:
         os.environ["OBSIDIAN_VAULT_PATH"] = vault_path
 
-    vault_paths = find_vaults()
-    if not vault_paths:
+    vaults = scan_vaults()
+    if not vaults:
         logger.error("No Obsidian vaults found. Set OBSIDIAN_VAULT_PATH to test a specific vault.")
-        return []
+    return vaults
 
-    all_vaults: List[ObsidianVault] = []
-    for vp in vault_paths:
-        notes = get_vault_notes(vp)
-        vault = ObsidianVault(path=vp, name=vp.name, notes=notes)
-        all_vaults.append(vault)
 
-    return all_vaults
+_SEP_LINE = "    " + "-" * 46
+_VAULT_SEP_LINE = "-" * 50 + "\n"
 
 
 def print_vaults(vaults: List[ObsidianVault]) -> None:
     """Print discovered vaults and notes."""
     print(f"Found {len(vaults)} Obsidian vault(s):\n")
     for vault in vaults:
-        print(format_vault_info(vault))
+        # build each vault's listing and write it in one call
+        lines = [format_vault_info(vault)]
         if vault.notes:
-            print("    Notes:")
+            lines.append("    Notes:")
             for n in vault.notes:
-                print(format_note_info(n, indent="    "))
-                print("    " + "-" * 46)
+                lines.append(format_note_info(n, indent="    "))
+                lines.append(_SEP_LINE)
         else:
-            print("    No notes found in this vault.\n")
-        print("-" * 50 + "\n")
+            lines.append("    No notes found in this vault.\n")
+        lines.append(_VAULT_SEP_LINE)
+        lines.append("")
+        sys.stdout.write("\n".join(lines))
 
 
 def ingest_vaults(
     vaults: List[ObsidianVault],
     aspects: Optional[List[str]] = None,
     dry_run: bool = False,
-    sleep_ms: int = 100,
+    sleep_ms: int = 0,
+    workers: Optional[int] = None,
+    sync: bool = False,
+    force: bool = False,
 ) -> None:
-    """Ingest vault metadata into DataHub."""
+    """Ingest vault metadata into DataHub.
+
+    Notes are emitted in chunks of NOTE_BATCH_SIZE, each chunk as one batch
+    of required aspects and one of best-effort aspects. By default chunks are
+    sent from an asyncio/aiohttp client with at most `workers` chunks in
+    flight. With `sync=True` they are sent through the DataHub SDK emitter
+    from a thread pool of `workers` threads, and `sleep_ms` is a global
+    minimum spacing between chunk emissions.
+    `workers` defaults to OBSIDIAN_DATAHUB_WORKERS.
+
+    Notes whose fingerprint matches the last successful emission recorded in
+    the StateStore are skipped unless `force` is set.
+    """
     if not vaults:
         logger.error("No vaults to ingest")
         return
@@ -74,17 +116,85 @@ def ingest_vaults(
                 logger.info("    Note: %s", note.relative_path)
         return
 
+    # the DataHub SDK is slow to import, so only load it once we emit
+    from .aspects import (
+        NOTE_BATCH_SIZE,
+        IngestContext,
+        create_datahub_emitter,
+        emit_notes_metadata,
+        ensure_domain_exists,
+    )
+
+    if aspects is None:
+        aspects = ALL_ASPECTS
+    ctx = IngestContext.from_env()
+
+    pairs = [(vault, note) for vault in vaults for note in vault.notes]
+    store = StateStore()
+    if not force:
+        discovered = len(pairs)
+        pairs = [
+            (vault, note) for vault, note in pairs
+            if store.get(str(note.path)) != note_fingerprint(note, aspects, ctx)
+        ]
+        if len(pairs) < discovered:
+            logger.info("Skipping %d unchanged note(s); use --force to re-emit", discovered - len(pairs))
+    if not pairs:
+        store.close()
+        return
+
+    total = len(pairs)
+    done = 0
+    incomplete = 0
+
+    def mark_done(vault: ObsidianVault, note: ObsidianNote, complete: bool = True) -> None:
+        nonlocal done, incomplete
+        # notes with a failed best-effort aspect are not recorded, so the next run retries them
+        if complete:
+            store.put(str(note.path), note_fingerprint(note, aspects, ctx))
+        else:
+            incomplete += 1
+        done += 1
+        if done % _PROGRESS_EVERY == 0:
+            logger.info("Emitted %d/%d notes", done, total)
+
+    limiter = _RateLimiter(sleep_ms / 1000.0)
+
+    # DatahubRestEmitter sends through a single requests.Session, which is
+    # safe to share between worker threads.
     emitter = create_datahub_emitter()
+
+    def emit_chunk(chunk) -> Set[str]:
+        limiter.wait()
+        return emit_notes_metadata(emitter, chunk, aspects, ctx)
+
     try:
-        for vault in vaults:
-            for note in vault.notes:
-                emit_note_metadata(emitter, note, vault, aspects)
-                # small sleep to avoid overwhelming the server
-                time.sleep(sleep_ms / 1000.0)
+        # create the domain once up front rather than per note
+        if "domain" in aspects and ctx.domain_urn:
+            ensure_domain_exists(emitter, ctx.domain_urn)
+
+        if sync:
+            if workers is None:
+                workers = int(os.getenv("OBSIDIAN_DATAHUB_WORKERS", str(DEFAULT_WORKERS)))
+            with ThreadPoolExecutor(max_workers=max(1, workers)) as ex:
+                chunks = [pairs[i:i + NOTE_BATCH_SIZE] for i in range(0, len(pairs), NOTE_BATCH_SIZE)]
+                futures = {ex.submit(emit_chunk, chunk): chunk for chunk in chunks}
+                for fut in as_completed(futures):
+                    # propagate worker exceptions; record successes from this thread
+                    failed = fut.result()
+                    for vault, note in futures[fut]:
+                        mark_done(vault, note, note.dataset_urn not in failed)
+        else:
+            from .aspects_async import DEFAULT_CONCURRENCY, ingest_notes_async
 
-        # allow backend a moment to index items
-        time.sleep(1)
+            if workers is None:
+                workers = int(os.getenv("OBSIDIAN_DATAHUB_WORKERS", str(DEFAULT_CONCURRENCY)))
+            ingest_notes_async(pairs, aspects, ctx, concurrency=workers, on_done=mark_done)
+        logger.info("Emitted %d note(s)", done)
+        if incomplete:
+            logger.warning("%d note(s) had failed optional aspects and will be retried on the next run", incomplete)
     finally:
+        store.close()
         emitter.close()
 
 
@@ -108,9 +218,24 @@ def main() -> None:
     parser.add_argument(
         "--aspects",
         nargs="+",
-        choices=["properties", "status", "ownership", "schema", "browse", "domain"],
+        choices=ALL_ASPECTS,
         help="Only emit specific aspects",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Maximum concurrent requests (threads with --sync) (default: OBSIDIAN_DATAHUB_WORKERS, else 32 async / 16 sync)",
+    )
+    parser.add_argument(
+        "--sync",
+        action="store_true",
+        help="Emit with the blocking DataHub SDK emitter from a thread pool instead of aiohttp",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Re-emit every note, ignoring the record of previously emitted notes",
+    )
     parser.add_argument(
         "--debug",
         action="store_true",
@@ -136,6 +261,8 @@ def main() -> None:
 
     # create domain if requested
     if args.create_domain:
+        from .aspects import create_datahub_emitter, ensure_domain_exists
+
         emitter = create_datahub_emitter()
         try:
             ensure_domain_exists(emitter)
@@ -145,7 +272,7 @@ def main() -> None:
 
     # ingest metadata
     print("\nIngesting metadata to DataHub...")
-    ingest_vaults(vaults, aspects=args.aspects, dry_run=args.dry_run)
+    ingest_vaults(vaults, aspects=args.aspects, dry_run=args.dry_run, workers=args.workers, sync=args.sync, force=args.force)
     print("Ingestion complete!")
 
 
@@ -5,36 +5,71 @@ from __future__ import annotations
 
 import os
 import datetime
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter
 from pathlib import Path
-from typing import List
-from dataclasses import dataclass
+from typing import Iterator, List, Optional
+from dataclasses import dataclass, field
 import logging
 
+from .urns import build_ids
+
 logger = logging.getLogger("obsidian-datahub.discovery")
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ObsidianNote:
+    """A markdown note; every derived value is computed once at construction."""
     path: Path
     vault: Path
-
-    def __post_init__(self):
-        self._stat = self.path.stat()
-
-    @property
-    def name(self) -> str:
-        return self.path.stem
+    name: str
+    relative_path: str
+    size: int
+    size_display: str
+    mtime: float
+    modified_time_iso: str
+    modified_display: str
+    dataset_name: str
+    dataset_urn: str
+
+    @classmethod
+    def from_stat(
+        cls,
+        path: Path,
+        vault: Path,
+        st: os.stat_result,
+        relative_path: Optional[str] = None,
+    ) -> "ObsidianNote":
+        """Build a note from an already-fetched stat result.
+
+        Pass `relative_path` when the caller already knows it (e.g. by
+        stripping a precomputed vault prefix) to skip os.path.relpath.
+        """
+        name = path.stem
+        _, _, dataset_name, dataset_urn = build_ids(vault.name, name)
+        modified_time_iso = datetime.datetime.fromtimestamp(st.st_mtime).isoformat()
+        return cls(
+            path=path,
+            vault=vault,
+            name=name,
+            relative_path=relative_path if relative_path is not None else os.path.relpath(path, vault),
+            size=st.st_size,
+            size_display=f"{st.st_size:,}",
+            mtime=st.st_mtime,
+            modified_time_iso=modified_time_iso,
+            # "YYYY-MM-DDTHH:MM:SS[.ffffff]" -> "YYYY-MM-DD HH:MM:SS" without strftime
+            modified_display=modified_time_iso[:19].replace("T", " "),
+            dataset_name=dataset_name,
+            dataset_urn=dataset_urn,
+        )
+
+    @classmethod
+    def from_path(cls, path: Path, vault: Path) -> "ObsidianNote":
+        """Build a note by stat-ing `path` (prefer the values from a directory scan)."""
+        return cls.from_stat(path, vault, path.stat())
 
     @property
     def modified_time(self) -> datetime.datetime:
-        return datetime.datetime.fromtimestamp(self._stat.st_mtime)
-
-    @property
-    def size(self) -> int:
-        return self._stat.st_size
-
-    @property
-    def relative_path(self) -> str:
-        return str(self.path.relative_to(self.vault))
+        return datetime.datetime.fromtimestamp(self.mtime)
 
 
 @dataclass
@@ -42,62 +77,115 @@ class ObsidianVault:
     path: Path
     name: str
     notes: List[ObsidianNote]
+    browse_prefix: str = field(init=False, repr=False)
+
+    def __post_init__(self):
+        # shared by every note's browse path
+        self.browse_prefix = f"obsidian/{self.name}"
 
 
 def find_vaults() -> List[Path]:
     """Discover Obsidian vault folders by looking for a `.obsidian` subfolder
-    under common locations."""
+    under common locations. Returns resolved paths, deduplicated and sorted."""
     potential_locations = [
         "~/Library/Mobile Documents/iCloud~md~obsidian/Documents",  # iCloud-synced vaults
         "~/Documents",  # local documents
         "~/Obsidian",  # common custom location
     ]
 
-    vaults: List[Path] = []
+    # keyed by real path so symlinked aliases of the same vault are listed once
+    vaults: set[str] = set()
     for loc in potential_locations:
-        base = Path(os.path.expanduser(loc))
-        if not base.exists():
+        base = os.path.expanduser(loc)
+        try:
+            with os.scandir(base) as it:
+                entries = list(it)
+        except (FileNotFoundError, NotADirectoryError, PermissionError):
             continue
-        for candidate in base.iterdir():
-            # ensure candidate is a directory and contains a .obsidian folder
-            if candidate.is_dir() and (candidate / ".obsidian").is_dir():
-                vaults.append(candidate.resolve())
+        for entry in entries:
+            # ensure candidate is a directory (d_type from readdir, no extra stat
+            # for plain dirs) and contains a .obsidian folder
+            if entry.is_dir() and os.path.isdir(os.path.join(entry.path, ".obsidian")):
+                vaults.add(os.path.realpath(entry.path))
 
     # Also allow a VAULT_PATH env var to point at a single vault for testing
     env_vault = os.getenv("OBSIDIAN_VAULT_PATH")
     if env_vault:
-        p = Path(os.path.expanduser(env_vault)).resolve()
-        if p.exists() and (p / ".obsidian").is_dir() and p not in vaults:
-            vaults.append(p)
-
-    return vaults
+        p = os.path.realpath(os.path.expanduser(env_vault))
+        if os.path.isdir(os.path.join(p, ".obsidian")):
+            vaults.add(p)
+
+    return [Path(p) for p in sorted(vaults)]
+
+
+def _scandir_recursive(path: str) -> Iterator[os.DirEntry]:
+    """Yield DirEntry objects for .md files under `path`, skipping .obsidian folders."""
+    try:
+        # materialize so the directory handle is closed before recursing
+        with os.scandir(path) as it:
+            entries = list(it)
+    except (PermissionError, FileNotFoundError, NotADirectoryError):
+        # unreadable, vanished or replaced directory; skip it like rglob does
+        return
+    for entry in entries:
+        if entry.name == ".obsidian":
+            continue
+        try:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _scandir_recursive(entry.path)
+            elif entry.name.endswith(".md") and entry.is_file():
+                yield entry
+        except OSError:
+            continue
 
 
 def get_vault_notes(vault_path: Path) -> List[ObsidianNote]:
     """Recursively list .md notes in the vault, excluding the .obsidian config folder."""
+    vault = vault_path.resolve()
+    # entries come back as "<vault>/<rel>", so the relative path is a plain slice
+    root = os.path.join(str(vault), "")
+    prefix_len = len(root)
     notes: List[ObsidianNote] = []
-    for p in vault_path.rglob("*.md"):
-        # skip files that are inside a .obsidian folder
-        if ".obsidian" in p.parts:
-            continue
+    for entry in _scandir_recursive(str(vault)):
         try:
-            notes.append(ObsidianNote(path=p.resolve(), vault=vault_path.resolve()))
+            st = entry.stat()
         except FileNotFoundError:
             # file may have been removed between discovery and stat; skip
             continue
+        notes.append(ObsidianNote.from_stat(Path(entry.path), vault, st, entry.path[prefix_len:]))
     # sort most recently modified first
-    notes.sort(key=lambda n: n.modified_time, reverse=True)
+    notes.sort(key=attrgetter("mtime"), reverse=True)
     return notes
 
 
+def scan_vaults() -> List[ObsidianVault]:
+    """Find vaults and return them with their notes already populated.
+
+    Vaults are independent, so with more than one they are scanned in
+    parallel threads; the walk is dominated by scandir/stat syscalls, which
+    release the GIL, and threads avoid process start-up cost on small vaults.
+    """
+    vault_paths = find_vaults()
+    if len(vault_paths) > 1:
+        with ThreadPoolExecutor(max_workers=len(vault_paths)) as ex:
+            notes_per_vault = list(ex.map(get_vault_notes, vault_paths))
+    else:
+        notes_per_vault = [get_vault_notes(vp) for vp in vault_paths]
+
+    return [
+        ObsidianVault(path=vp, name=vp.name, notes=notes)
+        for vp, notes in zip(vault_paths, notes_per_vault)
+    ]
+
+
 def format_vault_info(vault: ObsidianVault) -> str:
     return f"📚 Vault: {vault.name}\n   📂 Location: {vault.path}\n   📝 Notes: {len(vault.notes)}\n"
 
 
 def format_note_info(note: ObsidianNote, indent: str = "    ") -> str:
-    return (
-        f"{indent}📄 {note.name}\n"
-        f"{indent}   📂 Path: {note.relative_path}\n"
-        f"{indent}   🕒 Modified: {note.modified_time.strftime('%Y-%m-%d %H:%M:%S')}\n"
-        f"{indent}   📊 Size: {note.size:,} bytes\n"
-    )
\ No newline at end of file
+    return "".join((
+        indent, "📄 ", note.name, "\n",
+        indent, "   📂 Path: ", note.relative_path, "\n",
+        indent, "   🕒 Modified: ", note.modified_display, "\n",
+        indent, "   📊 Size: ", note.size_display, " bytes\n",
+    ))
@@ -0,0 +1,89 @@
+"""
+Persistent record of notes already emitted to DataHub.
+
+Lets re-runs skip notes whose size, mtime, selected aspects and run
+context (user, owner, domain) have not changed since the last successful
+emission to the same GMS.
+"""
+from __future__ import annotations
+
+import os
+import sqlite3
+import logging
+from typing import TYPE_CHECKING, Iterable, Optional
+
+from .discovery import ObsidianNote
+
+if TYPE_CHECKING:
+    from .aspects import IngestContext
+
+logger = logging.getLogger("obsidian-datahub.state")
+
+DEFAULT_STATE_PATH = "~/.cache/obsidian-datahub/state.db"
+DEFAULT_GMS = "http://localhost:8080"
+
+
+def note_fingerprint(note: ObsidianNote, aspects: Iterable[str], ctx: "IngestContext") -> str:
+    """Fingerprint of what would be emitted for a note.
+
+    Includes the user, owner and domain of the run so that changing
+    DATAHUB_OWNER_URN or DATAHUB_DOMAIN_URN re-emits every note.
+    """
+    return (
+        f"{note.size}:{int(note.mtime)}:{ctx.user}:{ctx.owner_urn}:{ctx.domain_urn or ''}:"
+        f"{','.join(sorted(aspects))}"
+    )
+
+
+class StateStore:
+    """SQLite-backed map of note path -> fingerprint of the last emission.
+
+    Rows are keyed by the note's file path rather than its dataset URN, since
+    notes with the same name in different folders share a URN; a moved or
+    renamed note therefore has no row and is re-emitted. Entries are scoped to the GMS they were emitted to (`gms`, default
+    DATAHUB_GMS), so pointing at another server re-emits everything.
+    Writes are committed every `commit_every` puts and on close. The
+    connection must only be used from the thread that created it.
+    """
+
+    def __init__(self, path: Optional[str] = None, gms: Optional[str] = None, commit_every: int = 1000):
+        path = os.path.expanduser(path or os.getenv("OBSIDIAN_DATAHUB_STATE_DB", DEFAULT_STATE_PATH))
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.path = path
+        self.gms = (gms or os.getenv("DATAHUB_GMS", DEFAULT_GMS)).rstrip("/")
+        self._commit_every = commit_every
+        self._pending = 0
+        self._conn = sqlite3.connect(path)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS emitted ("
+            "gms TEXT, note_path TEXT, fingerprint TEXT, PRIMARY KEY (gms, note_path))"
+        )
+
+    def get(self, note_path: str) -> Optional[str]:
+        row = self._conn.execute(
+            "SELECT fingerprint FROM emitted WHERE gms = ? AND note_path = ?", (self.gms, note_path)
+        ).fetchone()
+        return row[0] if row else None
+
+    def put(self, note_path: str, fingerprint: str) -> None:
+        self._conn.execute(
+            "INSERT OR REPLACE INTO emitted (gms, note_path, fingerprint) VALUES (?, ?, ?)",
+            (self.gms, note_path, fingerprint),
+        )
+        self._pending += 1
+        if self._pending >= self._commit_every:
+            self.commit()
+
+    def commit(self) -> None:
+        self._conn.commit()
+        self._pending = 0
+
+    def close(self) -> None:
+        self.commit()
+        self._conn.close()
+
+    def __enter__(self) -> "StateStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
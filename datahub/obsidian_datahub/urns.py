@@ -0,0 +1,21 @@
+"""
+Dataset naming and aspect names shared by discovery, the CLI and aspect
+generation. Kept free of DataHub SDK imports so listing vaults stays fast.
+"""
+from __future__ import annotations
+
+from typing import Tuple
+
+PLATFORM_URN = "urn:li:dataPlatform:obsidian"
+
+ALL_ASPECTS = ["properties", "status", "ownership", "schema", "browse", "domain"]
+
+
+def build_ids(vault_name: str, note_name: str) -> Tuple[str, str, str, str]:
+    """Return (safe_vault, safe_note, dataset_name, dataset_urn) for a note."""
+    # dataset name should be safe for urn; replace spaces with underscores
+    safe_vault = vault_name.replace(" ", "_")
+    safe_note = note_name.replace(" ", "_")
+    dataset_name = f"obsidian.{safe_vault}.{safe_note}"
+    dataset_urn = f"urn:li:dataset:({PLATFORM_URN},{dataset_name},PROD)"
+    return safe_vault, safe_note, dataset_name, dataset_urn
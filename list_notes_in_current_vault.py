@@ -4,11 +4,14 @@ List all Markdown notes in the Obsidian vault with their metadata.
 """
 
 import os
+import sys
 import datetime
 from pathlib import Path
 from typing import List, Dict
 
 class ObsidianNote:
+    __slots__ = ("path", "_stat")
+
     def __init__(self, path: Path):
         self.path = path
         self._stat = path.stat()
@@ -56,9 +59,13 @@ if __name__ == "__main__":
         notes = get_all_notes(VAULT_PATH)
         print(f"Found {len(notes)} notes in the vault:\n")
         
+        # Build the listing and write it in one call
+        lines = []
         for note in notes:
-            print(format_note_info(note))
-            print("-" * 50)
+            lines.append(format_note_info(note))
+            lines.append("-" * 50)
+        lines.append("")
+        sys.stdout.write("\n".join(lines))
             
     except Exception as e:
         print(f"Error: {e}")
@@ -4,6 +4,7 @@ List all Obsidian vaults and their notes with metadata.
 """
 
 import os
+import sys
 import datetime
 from pathlib import Path
 from typing import List, Dict, Generator
@@ -16,6 +17,8 @@ class ObsidianVault:
     notes: List['ObsidianNote']
 
 class ObsidianNote:
+    __slots__ = ("path", "vault", "_stat")
+
     def __init__(self, path: Path, vault: Path):
         self.path = path
         self.vault = vault
@@ -99,19 +102,18 @@ if __name__ == "__main__":
                 notes=notes
             )
             
-            # Print vault info
-            print(format_vault_info(vault))
-            
-            # Print notes in vault
+            # Build the vault listing and write it in one call
+            lines = [format_vault_info(vault)]
             if notes:
-                print("    Notes:")
+                lines.append("    Notes:")
                 for note in notes:
-                    print(format_note_info(note))
-                    print("    " + "-" * 46)
+                    lines.append(format_note_info(note))
+                    lines.append("    " + "-" * 46)
             else:
-                print("    No notes found in this vault.\n")
-            
-            print("-" * 50 + "\n")
+                lines.append("    No notes found in this vault.\n")
+            lines.append("-" * 50 + "\n")
+            lines.append("")
+            sys.stdout.write("\n".join(lines))
             
     except Exception as e:
         print(f"Error: {e}")
\ No newline at end of file
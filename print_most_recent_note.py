@@ -5,64 +5,87 @@ Uses standard Python packages to get window information.
 """
 
 import os
-import psutil
-import re
+import sys
 
 def get_obsidian_window_title():
-    """Get the title of the frontmost Obsidian window using psutil."""
-    for proc in psutil.process_iter(['pid', 'name']):
-        try:
-            if proc.info['name'] == 'Obsidian':
-                # Import AppKit here to avoid global import on non-macOS systems
-                from AppKit import NSWorkspace, NSApplicationActivationPolicyRegular
-                workspace = NSWorkspace.sharedWorkspace()
-                active_apps = workspace.runningApplications()
-                for app in active_apps:
-                    if app.activationPolicy() == NSApplicationActivationPolicyRegular and 'Obsidian' in app.localizedName():
-                        return app.localizedName()
-        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-            continue
+    """Get the name of the running Obsidian app from AppKit's running-application list."""
+    # Import AppKit here to avoid global import on non-macOS systems
+    from AppKit import NSWorkspace, NSApplicationActivationPolicyRegular
+    for app in NSWorkspace.sharedWorkspace().runningApplications():
+        if app.activationPolicy() == NSApplicationActivationPolicyRegular and 'Obsidian' in (app.localizedName() or ''):
+            return app.localizedName()
     return None
 
-def get_file_paths_under(root=".", *, suffix=""):
+def iter_md_entries(root=".", *, suffix=".md"):
+    """Yield os.DirEntry objects for files under `root` whose name ends with `suffix`."""
     if not os.path.isdir(root):
         raise ValueError(f"Cannot find files under non-existent directory: {root!r}")
-    for dirpath, _, filenames in os.walk(root):
-        for f in filenames:
-            p = os.path.join(dirpath, f)
-            if os.path.isfile(p) and f.lower().endswith(suffix):
-                yield p
+    yield from _scan(root, suffix)
 
-if __name__ == "__main__":
-    # Get Obsidian window title using psutil and AppKit
+def _scan(path, suffix):
+    try:
+        with os.scandir(path) as it:
+            entries = list(it)
+    except OSError:
+        # unreadable or vanished directory; skip it like os.walk does
+        return
+    for entry in entries:
+        try:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _scan(entry.path, suffix)
+            elif entry.name.lower().endswith(suffix) and entry.is_file():
+                yield entry
+        except OSError:
+            continue
+
+DEFAULT_VAULT_ROOT = "~/Library/Mobile Documents/iCloud~md~obsidian/Documents/Kha"
+
+def find_most_recent_note(vault_root):
+    """Return the path of the most recently modified markdown file under `vault_root`, or None."""
+    note_path = None
+    latest_mtime = 0
+
+    # single pass: each entry's stat() result gives the mtime without a second lookup
+    for entry in iter_md_entries(vault_root):
+        try:
+            mtime = entry.stat().st_mtime
+        except FileNotFoundError:
+            continue
+        if mtime > latest_mtime:
+            latest_mtime = mtime
+            note_path = entry.path
+    return note_path
+
+def main(argv=None):
+    """Print the most recently modified note; `argv` may hold a vault path overriding the default."""
+    if argv is None:
+        argv = sys.argv[1:]
+
+    # Get Obsidian window title using AppKit
     window_title = get_obsidian_window_title()
 
     if not window_title:
         raise RuntimeError("Could not find Obsidian window")
 
     # Use a more reliable method to find the vault
-    vault_root = os.path.expanduser("~/Library/Mobile Documents/iCloud~md~obsidian/Documents/Kha")
-    
+    vault_root = os.path.expanduser(argv[0] if argv else DEFAULT_VAULT_ROOT)
+
     if not os.path.exists(vault_root):
         raise ValueError(f"Could not find Obsidian vault at {vault_root}")
-    
+
     # Find the most recently modified markdown file in the vault
-    note_path = None
-    latest_mtime = 0
-    
-    for path in get_file_paths_under(vault_root, suffix=".md"):
-        mtime = os.path.getmtime(path)
-        if mtime > latest_mtime:
-            latest_mtime = mtime
-            note_path = path
+    note_path = find_most_recent_note(vault_root)
 
     if not note_path:
         raise RuntimeError("Could not find any markdown files in the vault")
 
     # Read and print the note content
-    with open(note_path, "r", encoding="utf-8") as f:
-        content = f.read()
-
-    print(f"Path: {note_path}\nContent:\n{content[:1000]}")  # Print first 1000 chars
+    # Only the first 1000 chars are shown, so read just those (text mode keeps newline translation)
+    with open(note_path, "r", encoding="utf-8", errors="replace") as f:
+        content = f.read(1000)
 
+    print(f"Path: {note_path}\nContent:\n{content}")  # Print first 1000 chars
+    return 0
 
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,63 +3,152 @@
 Query DataHub GraphQL API to fetch one or more dataset domain associations and print them.
 
 Usage:
-  python3 scripts/check_domain.py [--gms GMS_URL] [--retries N] [--delay S] [--timeout S] [--json] <urn1> [<urn2> ...]
+  python3 scripts/check_domain.py [--gms GMS_URL] [--retries N] [--delay S] [--timeout S] [--workers N] [--json] <urn1> [<urn2> ...]
 
 Examples:
   python3 scripts/check_domain.py "urn:li:dataset:(urn:li:dataPlatform:obsidian,obsidian.Kha.Python,PROD)"
   python3 scripts/check_domain.py --json urn1 urn2
 
 Features:
-  - Accepts multiple URNs
+  - Accepts multiple URNs, resolved in batched queries sent concurrently
   - Retries network requests with backoff
+  - Reuses keep-alive connections to GMS across lookups
   - Machine-friendly JSON output (aggregated)
 """
 import argparse
+import asyncio
+import functools
+import http.client
+import io
 import json
+import threading
 import time
 import sys
-from urllib.request import Request, urlopen
+from concurrent.futures import ThreadPoolExecutor
 from urllib.error import URLError, HTTPError
-from urllib.parse import urljoin
+from urllib.parse import urljoin, urlsplit
 
+try:
+    # faster (de)serialization of GraphQL payloads when available
+    import orjson
 
-DEFAULT_GMS = "http://localhost:8080"
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(',', ':')).encode('utf-8')
 
+    _loads = json.loads
 
-def graphql_query(gms_url: str, query: str, variables: dict, timeout: float = 10.0):
-    url = urljoin(gms_url, '/api/graphql')
-    payload = json.dumps({"query": query, "variables": variables}).encode('utf-8')
-    req = Request(url, data=payload, headers={
-        'Content-Type': 'application/json',
-        'Accept': 'application/json',
-    })
-    with urlopen(req, timeout=timeout) as resp:
-        return json.load(resp)
 
+DEFAULT_GMS = "http://localhost:8080"
+DEFAULT_RETRIES = 3
+DEFAULT_DELAY = 2.0
+DEFAULT_TIMEOUT = 10.0
+# Maximum number of batch queries in flight at once (one thread each)
+DEFAULT_WORKERS = 16
+# URNs resolved per GraphQL entities(urns:) query
+DEFAULT_BATCH_SIZE = 100
 
-def fetch_domain_for_urn(urn: str, gms: str, timeout: float):
-    query = '''query dataset($urn: String!) {
-      dataset(urn: $urn) {
+
+_DATASET_DOMAIN_QUERY = '''query dataset($urn: String!) {
+  dataset(urn: $urn) {
+    urn
+    domain {
+      domain {
         urn
+        id
+        properties { name description }
+      }
+    }
+  }
+}'''
+
+_ENTITIES_DOMAIN_QUERY = '''query entities($urns: [String!]!) {
+  entities(urns: $urns) {
+    urn
+    __typename
+    ... on Dataset {
+      domain {
         domain {
-          associatedUrn
-          domain {
-            urn
-            id
-            properties { name description }
-          }
+          urn
+          id
+          properties { name description }
         }
       }
-    }'''
+    }
+  }
+}'''
+
+_JSON_HEADERS = {
+    'Content-Type': 'application/json',
+    'Accept': 'application/json',
+}
+
+# Keep-alive connections, one per (scheme, host) for each thread; http.client
+# connections are not thread-safe, so concurrent lookups must not share them.
+_local = threading.local()
+
+
+def _get_connection(scheme: str, netloc: str, timeout: float):
+    """Return (connection, reused) for this thread, opening one if needed."""
+    conns = getattr(_local, 'conns', None)
+    if conns is None:
+        conns = _local.conns = {}
+    conn = conns.get((scheme, netloc))
+    if conn is not None:
+        conn.timeout = timeout
+        if conn.sock is not None:
+            conn.sock.settimeout(timeout)
+        return conn, True
+    cls = http.client.HTTPSConnection if scheme == 'https' else http.client.HTTPConnection
+    conn = conns[(scheme, netloc)] = cls(netloc, timeout=timeout)
+    return conn, False
+
+
+def _drop_connection(scheme: str, netloc: str):
+    conn = getattr(_local, 'conns', {}).pop((scheme, netloc), None)
+    if conn is not None:
+        conn.close()
+
+
+def graphql_query(gms_url: str, query: str, variables: dict, timeout: float = 10.0):
+    url = urljoin(gms_url, '/api/graphql')
+    parts = urlsplit(url)
+    path = parts.path + ('?' + parts.query if parts.query else '')
+    payload = _dumps({"query": query, "variables": variables})
+    while True:
+        conn, reused = _get_connection(parts.scheme, parts.netloc, timeout)
+        try:
+            conn.request('POST', path, body=payload, headers=_JSON_HEADERS)
+            resp = conn.getresponse()
+            body = resp.read()
+            break
+        except (OSError, http.client.HTTPException) as e:
+            _drop_connection(parts.scheme, parts.netloc)
+            # the server may have closed an idle keep-alive connection; reconnect once
+            if reused and isinstance(e, (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError)):
+                continue
+            raise URLError(e) from e
+    if not 200 <= resp.status < 300:
+        raise HTTPError(url, resp.status, resp.reason, resp.headers, io.BytesIO(body))
+    return _loads(body)
+
+
+def fetch_domain_for_urn(urn: str, gms: str, timeout: float):
     variables = {"urn": urn}
-    resp = graphql_query(gms, query, variables, timeout=timeout)
+    resp = graphql_query(gms, _DATASET_DOMAIN_QUERY, variables, timeout=timeout)
     # Handle GraphQL errors
     if resp is None:
         return {'urn': urn, 'error': 'no_response', 'domain': None}
     if 'errors' in resp and resp['errors']:
         return {'urn': urn, 'error': 'graphql_errors', 'errors': resp['errors'], 'domain': None}
     data = resp.get('data', {}) or {}
-    dataset = data.get('dataset')
+    return _domain_result(urn, data.get('dataset'))
+
+
+def _domain_result(urn: str, dataset):
+    """Build the per-URN result dict from a dataset (or entity) GraphQL object."""
     if not dataset:
         return {'urn': urn, 'error': 'not_found', 'domain': None}
     domain_assoc = dataset.get('domain')
@@ -69,6 +158,23 @@ def fetch_domain_for_urn(urn: str, gms: str, timeout: float):
     return {'urn': urn, 'error': None, 'domain': dom}
 
 
+def fetch_domains_for_urns(urns, gms: str, timeout: float):
+    """Resolve several URNs with one `entities(urns:)` query; results follow input order."""
+    variables = {"urns": list(urns)}
+    resp = graphql_query(gms, _ENTITIES_DOMAIN_QUERY, variables, timeout=timeout)
+    if resp is None:
+        return [{'urn': urn, 'error': 'no_response', 'domain': None} for urn in urns]
+    if 'errors' in resp and resp['errors']:
+        # one bad URN fails the whole batch; resolve each URN on its own so
+        # errors stay attributed to the URN that caused them
+        return [fetch_domain_for_urn(urn, gms, timeout=timeout) for urn in urns]
+    data = resp.get('data', {}) or {}
+    # unknown URNs come back as null entries or are left out entirely; other
+    # entity types are not_found too, as they are for the dataset(urn:) query
+    found = {e['urn']: e for e in (data.get('entities') or []) if e and e.get('__typename') == 'Dataset'}
+    return [_domain_result(urn, found.get(urn)) for urn in urns]
+
+
 def fetch_with_retries(urn: str, gms: str, retries: int, delay: float, timeout: float):
     last_exc = None
     for attempt in range(1, retries + 1):
@@ -85,28 +191,87 @@ def fetch_with_retries(urn: str, gms: str, retries: int, delay: float, timeout:
             return {'urn': urn, 'error': 'exception', 'exception': str(e), 'domain': None}
 
 
+async def fetch_batch_with_retries_async(urns, gms: str, retries: int, delay: float, timeout: float,
+                                         executor: ThreadPoolExecutor):
+    """Async, batched counterpart of fetch_with_retries.
+
+    The blocking batch query runs on `executor`; a transient failure
+    retries the whole batch, and a final failure is reported for every URN.
+    """
+    loop = asyncio.get_running_loop()
+    for attempt in range(1, max(1, retries) + 1):
+        try:
+            return await loop.run_in_executor(
+                executor, functools.partial(fetch_domains_for_urns, urns, gms, timeout=timeout),
+            )
+        except (HTTPError, URLError) as e:
+            if attempt < retries:
+                # sleep on the event loop so the worker thread serves other batches
+                await asyncio.sleep(delay)
+                continue
+            return [{'urn': urn, 'error': 'network_error', 'exception': str(e), 'domain': None} for urn in urns]
+        except Exception as e:
+            return [{'urn': urn, 'error': 'exception', 'exception': str(e), 'domain': None} for urn in urns]
+
+
+async def fetch_all_async(urns, gms: str, retries: int, delay: float, timeout: float,
+                          workers: int = DEFAULT_WORKERS, batch_size: int = DEFAULT_BATCH_SIZE):
+    """Look up all URNs in concurrent batches; results are returned in input order.
+
+    At most `workers` batch queries are in flight, each on its own thread and
+    keep-alive connection; no more threads are started than there are batches.
+    """
+    batches = [urns[i:i + batch_size] for i in range(0, len(urns), batch_size)]
+    if not batches:
+        return []
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(batches)))) as executor:
+        results = await asyncio.gather(*[
+            fetch_batch_with_retries_async(batch, gms, retries, delay, timeout, executor) for batch in batches
+        ])
+    return [r for batch_results in results for r in batch_results]
+
+
 def main(argv=None):
-    parser = argparse.ArgumentParser(description='Check DataHub dataset domains via GraphQL')
-    parser.add_argument('--gms', default=DEFAULT_GMS, help='DataHub GMS base URL')
-    parser.add_argument('--retries', type=int, default=3, help='Number of retries for network calls')
-    parser.add_argument('--delay', type=float, default=2.0, help='Delay (seconds) between retries')
-    parser.add_argument('--timeout', type=float, default=10.0, help='Request timeout (seconds)')
-    parser.add_argument('--json', action='store_true', help='Output aggregated JSON array')
-    parser.add_argument('urns', nargs='+', help='One or more dataset URNs to check')
-    args = parser.parse_args(argv)
-
-    results = []
-    for urn in args.urns:
-        r = fetch_with_retries(urn, args.gms, retries=args.retries, delay=args.delay, timeout=args.timeout)
-        results.append(r)
-
-    if args.json:
+    if argv is None:
+        argv = sys.argv[1:]
+
+    if len(argv) == 1 and argv[0].startswith('urn:'):
+        # common single-URN call: skip building the parser and the batch machinery
+        results = [fetch_with_retries(argv[0], DEFAULT_GMS, retries=DEFAULT_RETRIES, delay=DEFAULT_DELAY,
+                                      timeout=DEFAULT_TIMEOUT)]
+        as_json = False
+    else:
+        parser = argparse.ArgumentParser(description='Check DataHub dataset domains via GraphQL')
+        parser.add_argument('--gms', default=DEFAULT_GMS, help='DataHub GMS base URL')
+        parser.add_argument('--retries', type=int, default=DEFAULT_RETRIES, help='Number of retries for network calls')
+        parser.add_argument('--delay', type=float, default=DEFAULT_DELAY, help='Delay (seconds) between retries')
+        parser.add_argument('--timeout', type=float, default=DEFAULT_TIMEOUT, help='Request timeout (seconds)')
+        parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS,
+                            help='Maximum number of concurrent GraphQL requests')
+        parser.add_argument('--json', action='store_true', help='Output aggregated JSON array')
+        parser.add_argument('urns', nargs='+', help='One or more dataset URNs to check')
+        args = parser.parse_args(argv)
+
+        # look each distinct URN up once, then report in the order given
+        unique = list(dict.fromkeys(args.urns))
+        by_urn = dict(zip(unique, asyncio.run(fetch_all_async(
+            unique, args.gms, retries=args.retries, delay=args.delay, timeout=args.timeout, workers=args.workers,
+        ))))
+        results = [by_urn[urn] for urn in args.urns]
+        as_json = args.json
+
+    # Return non-zero if any network errors occurred
+    had_error = False
+    if as_json:
+        had_error = any(r.get('error') in ('network_error', 'exception') for r in results)
         print(json.dumps(results, indent=2))
     else:
         # Human readable
         for r in results:
             urn = r.get('urn')
             if r.get('error'):
+                if r.get('error') in ('network_error', 'exception'):
+                    had_error = True
                 print(f"{urn}: ERROR={r.get('error')} {r.get('exception','')}")
                 if r.get('errors'):
                     print(json.dumps(r.get('errors'), indent=2))
@@ -122,12 +287,7 @@ def main(argv=None):
                         if props.get('description'):
                             print(f"  desc: {props.get('description')}")
 
-    # Return non-zero if any network errors occurred
-    for r in results:
-        if r.get('error') in ('network_error','exception'):
-            return 1
-    return 0
-
+    return 1 if had_error else 0
 
 if __name__ == '__main__':
     sys.exit(main())
@@ -0,0 +1,25 @@
+"""Print signatures and docstrings of the DataHub schema-related classes."""
+import inspect
+
+names = ['SchemaFieldDataTypeClass','SchemalessClass','SchemaFieldSpecClass','SchemaFieldInfoClass','SchemaMetadataClass','SchemaFieldClass']
+
+
+def main():
+    import datahub.metadata.schema_classes as sc
+
+    for n in names:
+        cls = getattr(sc, n, None)
+        print('='*60)
+        print(n, 'FOUND' if cls else 'MISSING')
+        if cls:
+            try:
+                print('  sig:', inspect.signature(cls))
+            except Exception as e:
+                print('  sig: error', e)
+            doc = (cls.__doc__ or '').splitlines()[:3]
+            for l in doc:
+                print('  ', l)
+
+
+if __name__ == "__main__":
+    main()
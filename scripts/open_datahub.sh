@@ -33,7 +33,7 @@ fi
 echo -e "\nListing ingested Obsidian vaults..."
 VENV_PYTHON="$(dirname "$(dirname "$0")")/.venv/bin/python"
 if [ -x "$VENV_PYTHON" ]; then
-    "$VENV_PYTHON" "$(dirname "$(dirname "$0")")/datahub/obsidian_datahub_ingestion.py" --list-only
+    "$VENV_PYTHON" "$(dirname "$(dirname "$0")")/datahub/obsidian_datahub_cli.py" --list-only
 else
     echo "Note: Python venv not found. Run setup.sh first to see vault info."
 fi
\ No newline at end of file
@@ -25,4 +25,4 @@ fi
 
 # Run the ingestion
 echo "Using DataHub GMS at $DATAHUB_GMS"
-"$VENV_PYTHON" "$(dirname "$(dirname "$0")")/datahub/obsidian_datahub_ingestion.py"
\ No newline at end of file
+"$VENV_PYTHON" "$(dirname "$(dirname "$0")")/datahub/obsidian_datahub_cli.py"
\ No newline at end of file
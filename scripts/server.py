@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Long-lived worker that runs the helper scripts without a fresh interpreter per call.
+
+Usage:
+  python3 scripts/server.py [--socket PATH]
+
+Clients connect to the unix socket, send one command line and read the
+script's output until the server closes the connection:
+
+  printf '%s\\n' 'check_domain --json urn:li:dataset:...' | nc -U ~/.cache/obsidian-datahub/scripts.sock
+  printf '%s\\n' 'print_most_recent_note' | nc -U ~/.cache/obsidian-datahub/scripts.sock
+
+The first word selects the script, the rest is passed to its main(argv).
+The last line of every response is `exit: <code>`.
+
+Features:
+  - Python startup and imports (AppKit, GraphQL client) are paid once per worker
+  - Requests are handled one at a time, since scripts write to the shared stdout
+  - Refuses to start if another server is already listening on the socket
+"""
+import argparse
+import io
+import os
+import shlex
+import socket
+import socketserver
+import sys
+import traceback
+from contextlib import redirect_stderr, redirect_stdout
+
+# print_most_recent_note.py lives at the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import print_most_recent_note  # noqa: E402
+from scripts import check_domain  # noqa: E402
+
+
+DEFAULT_SOCKET = "~/.cache/obsidian-datahub/scripts.sock"
+
+# Seconds to wait for a client's command line; requests are served one at a
+# time, so a client that never sends a newline must not stall the server.
+READ_TIMEOUT = 10.0
+
+COMMANDS = {
+    'check_domain': check_domain.main,
+    'print_most_recent_note': print_most_recent_note.main,
+}
+
+
+def run_command(line: str):
+    """Run one command line and return (output, exit_code)."""
+    out = io.StringIO()
+    try:
+        argv = shlex.split(line)
+    except ValueError as e:
+        return f"Error: {e}\n", 2
+    if not argv or argv[0] not in COMMANDS:
+        return f"Error: expected one of {', '.join(sorted(COMMANDS))}\n", 2
+    with redirect_stdout(out), redirect_stderr(out):
+        try:
+            code = COMMANDS[argv[0]](argv[1:]) or 0
+        except SystemExit as e:
+            # argparse exits on --help and usage errors
+            code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+        except Exception:
+            traceback.print_exc()
+            code = 1
+    return out.getvalue(), code
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    timeout = READ_TIMEOUT
+
+    def handle(self):
+        try:
+            line = self.rfile.readline().decode('utf-8', errors='replace')
+        except socket.timeout:
+            self.wfile.write(f"Error: no command received within {self.timeout:g}s\nexit: 2\n".encode('utf-8'))
+            return
+        output, code = run_command(line)
+        self.wfile.write(f"{output}exit: {code}\n".encode('utf-8'))
+
+
+def is_listening(path: str) -> bool:
+    """Return True if a server accepts connections on the unix socket at `path`."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(path)
+        except OSError:
+            return False
+    return True
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Serve the helper scripts over a unix socket')
+    parser.add_argument('--socket', default=DEFAULT_SOCKET, help='Unix socket path to listen on')
+    args = parser.parse_args(argv)
+
+    path = os.path.expanduser(args.socket)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    if os.path.exists(path):
+        if is_listening(path):
+            print(f"Error: a server is already listening on {path}", file=sys.stderr)
+            return 1
+        # remove a socket left behind by a worker that did not shut down cleanly
+        os.unlink(path)
+
+    with socketserver.UnixStreamServer(path, _Handler) as server:
+        print(f"Listening on {path}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            os.unlink(path)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,4 +1,7 @@
+import io
+import json
 import unittest
+from contextlib import redirect_stdout
 from urllib.error import URLError
 
 import scripts.check_domain as cd
@@ -73,6 +76,131 @@ class TestCheckDomain(unittest.TestCase):
         finally:
             cd.graphql_query = orig
 
+    def test_fetch_domains_for_urns_maps_missing(self):
+        orig = cd.graphql_query
+
+        def fake_graphql_query(gms, query, variables, timeout=10.0):
+            return {
+                "data": {
+                    "entities": [
+                        None,
+                        {"urn": "urn:li:dataset:b", "__typename": "Dataset", "domain": None},
+                    ]
+                }
+            }
+
+        try:
+            cd.graphql_query = fake_graphql_query
+            res = cd.fetch_domains_for_urns(
+                ["urn:li:dataset:a", "urn:li:dataset:b"], "http://localhost:8080", timeout=5.0
+            )
+            self.assertEqual([r["urn"] for r in res], ["urn:li:dataset:a", "urn:li:dataset:b"])
+            self.assertEqual(res[0]["error"], "not_found")
+            self.assertIsNone(res[1]["error"])
+            self.assertIsNone(res[1]["domain"])
+        finally:
+            cd.graphql_query = orig
+
+    def test_fetch_domains_for_urns_non_dataset_is_not_found(self):
+        orig = cd.graphql_query
+
+        def fake_graphql_query(gms, query, variables, timeout=10.0):
+            return {
+                "data": {
+                    "entities": [
+                        {"urn": "urn:li:corpuser:alice", "__typename": "CorpUser"},
+                        {"urn": "urn:li:dataset:b", "__typename": "Dataset", "domain": None},
+                    ]
+                }
+            }
+
+        try:
+            cd.graphql_query = fake_graphql_query
+            res = cd.fetch_domains_for_urns(
+                ["urn:li:corpuser:alice", "urn:li:dataset:b"], "http://localhost:8080", timeout=5.0
+            )
+            self.assertEqual(res[0]["error"], "not_found")
+            self.assertIsNone(res[1]["error"])
+        finally:
+            cd.graphql_query = orig
+
+    def test_fetch_domains_for_urns_falls_back_per_urn_on_errors(self):
+        orig = cd.graphql_query
+
+        def fake_graphql_query(gms, query, variables, timeout=10.0):
+            if "urns" in variables:
+                return {"errors": [{"message": "invalid urn"}], "data": None}
+            if variables["urn"] == "urn:bad":
+                return {"errors": [{"message": "invalid urn"}]}
+            return {"data": {"dataset": {"urn": variables["urn"], "domain": None}}}
+
+        try:
+            cd.graphql_query = fake_graphql_query
+            res = cd.fetch_domains_for_urns(["urn:li:dataset:a", "urn:bad"], "http://localhost:8080", timeout=5.0)
+            self.assertEqual([r["urn"] for r in res], ["urn:li:dataset:a", "urn:bad"])
+            self.assertIsNone(res[0]["error"])
+            self.assertEqual(res[1]["error"], "graphql_errors")
+        finally:
+            cd.graphql_query = orig
+
+    def test_main_batches_and_preserves_urn_order(self):
+        orig = cd.graphql_query
+        batches = []
+
+        def fake_graphql_query(gms, query, variables, timeout=10.0):
+            batches.append(variables["urns"])
+            return {"data": {"entities": [{"urn": u, "__typename": "Dataset", "domain": None} for u in reversed(variables["urns"])]}}
+
+        urns = [f"urn:li:dataset:test{i}" for i in range(cd.DEFAULT_BATCH_SIZE + 5)]
+        out = io.StringIO()
+        try:
+            cd.graphql_query = fake_graphql_query
+            with redirect_stdout(out):
+                rc = cd.main(["--json", *urns])
+            self.assertEqual(rc, 0)
+            self.assertEqual(sorted(len(b) for b in batches), [5, cd.DEFAULT_BATCH_SIZE])
+            self.assertEqual([r["urn"] for r in json.loads(out.getvalue())], urns)
+        finally:
+            cd.graphql_query = orig
+
+    def test_main_looks_up_duplicate_urns_once(self):
+        orig = cd.graphql_query
+        batches = []
+
+        def fake_graphql_query(gms, query, variables, timeout=10.0):
+            batches.append(variables["urns"])
+            return {"data": {"entities": [{"urn": u, "__typename": "Dataset", "domain": None} for u in variables["urns"]]}}
+
+        urns = ["urn:li:dataset:a", "urn:li:dataset:b", "urn:li:dataset:a"]
+        out = io.StringIO()
+        try:
+            cd.graphql_query = fake_graphql_query
+            with redirect_stdout(out):
+                cd.main(["--json", *urns])
+            self.assertEqual(batches, [["urn:li:dataset:a", "urn:li:dataset:b"]])
+            self.assertEqual([r["urn"] for r in json.loads(out.getvalue())], urns)
+        finally:
+            cd.graphql_query = orig
+
+    def test_main_single_urn_fast_path(self):
+        orig = cd.graphql_query
+        calls = []
+
+        def fake_graphql_query(gms, query, variables, timeout=10.0):
+            calls.append((gms, variables))
+            return {"data": {"dataset": {"urn": variables["urn"], "domain": None}}}
+
+        out = io.StringIO()
+        try:
+            cd.graphql_query = fake_graphql_query
+            with redirect_stdout(out):
+                rc = cd.main(["urn:li:dataset:single"])
+            self.assertEqual(rc, 0)
+            self.assertEqual(calls, [(cd.DEFAULT_GMS, {"urn": "urn:li:dataset:single"})])
+            self.assertEqual(out.getvalue(), "urn:li:dataset:single: no domain assigned\n")
+        finally:
+            cd.graphql_query = orig
+
 
 if __name__ == '__main__':
     unittest.main()
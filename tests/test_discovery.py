@@ -0,0 +1,126 @@
+import io
+import os
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "datahub"))
+
+from obsidian_datahub.cli import print_vaults
+from obsidian_datahub.discovery import (
+    ObsidianVault,
+    _scandir_recursive,
+    find_vaults,
+    format_vault_info,
+    get_vault_notes,
+)
+
+
+def _touch(path: Path, text: str = "", mtime: float = None) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+    if mtime is not None:
+        os.utime(path, (mtime, mtime))
+
+
+class TestVaultNotes(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.vault = Path(os.path.realpath(self.tmp.name)) / "Vault"
+        _touch(self.vault / ".obsidian" / "hidden.md")
+        _touch(self.vault / "top.md", "top", mtime=1_000_000)
+        _touch(self.vault / "a" / "b" / "deep.md", "deep", mtime=3_000_000)
+        _touch(self.vault / "a" / "mid.md", "mid", mtime=2_000_000)
+        _touch(self.vault / "a" / "image.png")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_walker_skips_obsidian_folder_and_non_markdown(self):
+        names = sorted(entry.name for entry in _scandir_recursive(str(self.vault)))
+        self.assertEqual(names, ["deep.md", "mid.md", "top.md"])
+
+    def test_walker_does_not_follow_directory_symlinks(self):
+        os.symlink(self.vault / "a", self.vault / "loop")
+        names = sorted(entry.name for entry in _scandir_recursive(str(self.vault)))
+        self.assertEqual(names, ["deep.md", "mid.md", "top.md"])
+
+    def test_relative_paths_in_nested_folders(self):
+        notes = {note.name: note for note in get_vault_notes(self.vault)}
+        self.assertEqual(notes["deep"].relative_path, os.path.join("a", "b", "deep.md"))
+        self.assertEqual(notes["mid"].relative_path, os.path.join("a", "mid.md"))
+        self.assertEqual(notes["top"].relative_path, "top.md")
+        self.assertEqual(notes["deep"].path, self.vault / "a" / "b" / "deep.md")
+
+    def test_notes_sorted_most_recent_first(self):
+        self.assertEqual([note.name for note in get_vault_notes(self.vault)], ["deep", "mid", "top"])
+
+
+class TestFindVaults(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.home = Path(os.path.realpath(self.tmp.name))
+        self.vault = self.home / "Documents" / "Vault"
+        (self.vault / ".obsidian").mkdir(parents=True)
+        (self.home / "Documents" / "NotAVault").mkdir()
+        (self.home / "Obsidian").mkdir()
+        os.symlink(self.vault, self.home / "Obsidian" / "Alias")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_symlinked_alias_listed_once(self):
+        with mock.patch.dict(os.environ, {"HOME": str(self.home)}):
+            os.environ.pop("OBSIDIAN_VAULT_PATH", None)
+            self.assertEqual(find_vaults(), [self.vault])
+
+    def test_env_vault_deduplicated_by_real_path(self):
+        env = {"HOME": str(self.home), "OBSIDIAN_VAULT_PATH": str(self.home / "Obsidian" / "Alias")}
+        with mock.patch.dict(os.environ, env):
+            self.assertEqual(find_vaults(), [self.vault])
+
+
+class TestPrintVaults(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.vault_path = Path(os.path.realpath(self.tmp.name)) / "Vault"
+        _touch(self.vault_path / "one.md", "x" * 1234, mtime=1_700_000_000)
+        _touch(self.vault_path / "sub" / "two.md", "y", mtime=1_600_000_000)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_output_matches_print_based_listing(self):
+        vaults = [
+            ObsidianVault(path=self.vault_path, name="Vault", notes=get_vault_notes(self.vault_path)),
+            ObsidianVault(path=self.vault_path, name="Empty", notes=[]),
+        ]
+        # the listing as originally produced with one print() per line
+        expected = io.StringIO()
+        with redirect_stdout(expected):
+            print(f"Found {len(vaults)} Obsidian vault(s):\n")
+            for vault in vaults:
+                print(format_vault_info(vault))
+                if vault.notes:
+                    print("    Notes:")
+                    for n in vault.notes:
+                        print(f"    📄 {n.name}")
+                        print(f"       📂 Path: {n.relative_path}")
+                        print(f"       🕒 Modified: {n.modified_time.strftime('%Y-%m-%d %H:%M:%S')}")
+                        print(f"       📊 Size: {n.size:,} bytes\n")
+                        print("    " + "-" * 46)
+                else:
+                    print("    No notes found in this vault.\n")
+                print("-" * 50 + "\n")
+
+        actual = io.StringIO()
+        with redirect_stdout(actual):
+            print_vaults(vaults)
+        self.assertEqual(actual.getvalue(), expected.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+import io
+import os
+import socket
+import tempfile
+import threading
+import unittest
+from contextlib import redirect_stderr
+
+import scripts.check_domain as cd
+import scripts.server as server
+
+
+class TestRunCommand(unittest.TestCase):
+    def test_unknown_command(self):
+        output, code = server.run_command("rm -rf /\n")
+        self.assertEqual(code, 2)
+        self.assertIn("expected one of check_domain, print_most_recent_note", output)
+
+    def test_empty_line(self):
+        _, code = server.run_command("\n")
+        self.assertEqual(code, 2)
+
+    def test_unbalanced_quotes(self):
+        output, code = server.run_command("check_domain 'urn:li:dataset:a\n")
+        self.assertEqual(code, 2)
+        self.assertTrue(output.startswith("Error: "))
+
+    def test_usage_error_exit_code_is_returned(self):
+        # argparse exits with 2 when no URNs are given; the server must survive it
+        output, code = server.run_command("check_domain --json\n")
+        self.assertEqual(code, 2)
+        self.assertIn("usage:", output)
+
+    def test_dispatches_to_script_main(self):
+        orig = cd.graphql_query
+
+        def fake_graphql_query(gms, query, variables, timeout=10.0):
+            return {"data": {"dataset": {"urn": variables["urn"], "domain": None}}}
+
+        try:
+            cd.graphql_query = fake_graphql_query
+            output, code = server.run_command("check_domain urn:li:dataset:a\n")
+        finally:
+            cd.graphql_query = orig
+        self.assertEqual(code, 0)
+        self.assertIn("urn:li:dataset:a", output)
+
+
+class TestIsListening(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "s.sock")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_stale_socket_is_not_listening(self):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.bind(self.path)
+        sock.close()
+        self.assertFalse(server.is_listening(self.path))
+
+    def test_live_socket_is_listening(self):
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.bind(self.path)
+            sock.listen(1)
+            self.assertTrue(server.is_listening(self.path))
+
+    def test_main_refuses_to_replace_a_live_server(self):
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.bind(self.path)
+            sock.listen(1)
+            err = io.StringIO()
+            with redirect_stderr(err):
+                self.assertEqual(server.main(["--socket", self.path]), 1)
+            self.assertIn("already listening", err.getvalue())
+            self.assertTrue(os.path.exists(self.path))
+
+
+class TestHandler(unittest.TestCase):
+    def test_client_without_newline_times_out(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        path = os.path.join(tmp.name, "s.sock")
+        orig = server._Handler.timeout
+        server._Handler.timeout = 0.1
+        self.addCleanup(setattr, server._Handler, "timeout", orig)
+
+        with server.socketserver.UnixStreamServer(path, server._Handler) as srv:
+            t = threading.Thread(target=srv.handle_request)
+            t.start()
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+                client.connect(path)
+                client.sendall(b"check_domain")
+                reply = client.makefile("rb").read()
+            t.join(5)
+        self.assertFalse(t.is_alive())
+        self.assertTrue(reply.endswith(b"exit: 2\n"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "datahub"))
+
+from obsidian_datahub.discovery import ObsidianNote
+from obsidian_datahub.state import StateStore, note_fingerprint
+
+# stands in for aspects.IngestContext, which needs the DataHub SDK
+CTX = SimpleNamespace(user="alice", owner_urn="urn:li:corpuser:alice", domain_urn=None)
+
+
+class TestNoteFingerprint(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.vault = Path(self.tmp.name) / "Vault"
+        (self.vault / "sub").mkdir(parents=True)
+        self.path = self.vault / "a.md"
+        self.path.write_text("hello")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_unchanged_note_has_same_fingerprint(self):
+        a = ObsidianNote.from_path(self.path, self.vault)
+        b = ObsidianNote.from_path(self.path, self.vault)
+        self.assertEqual(
+            note_fingerprint(a, ["status", "properties"], CTX), note_fingerprint(b, ["properties", "status"], CTX)
+        )
+
+    def test_aspects_change_fingerprint(self):
+        note = ObsidianNote.from_path(self.path, self.vault)
+        self.assertNotEqual(note_fingerprint(note, ["status"], CTX), note_fingerprint(note, ["status", "browse"], CTX))
+
+    def test_context_changes_fingerprint(self):
+        note = ObsidianNote.from_path(self.path, self.vault)
+        before = note_fingerprint(note, ["status"], CTX)
+        for change in (
+            {"user": "bob"},
+            {"owner_urn": "urn:li:corpGroup:team"},
+            {"domain_urn": "urn:li:domain:notes"},
+        ):
+            ctx = SimpleNamespace(**{**vars(CTX), **change})
+            self.assertNotEqual(note_fingerprint(note, ["status"], ctx), before, change)
+
+
+class TestStateStore(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db = os.path.join(self.tmp.name, "state.db")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_put_get_persists_across_instances(self):
+        with StateStore(self.db, gms="http://gms-a:8080") as store:
+            self.assertIsNone(store.get("urn:a"))
+            store.put("urn:a", "fp1")
+            self.assertEqual(store.get("urn:a"), "fp1")
+        with StateStore(self.db, gms="http://gms-a:8080") as store:
+            self.assertEqual(store.get("urn:a"), "fp1")
+
+    def test_entries_are_scoped_to_gms(self):
+        with StateStore(self.db, gms="http://gms-a:8080") as store:
+            store.put("urn:a", "fp1")
+        with StateStore(self.db, gms="http://gms-b:8080") as store:
+            self.assertIsNone(store.get("urn:a"))
+        # trailing slash does not create a separate scope
+        with StateStore(self.db, gms="http://gms-a:8080/") as store:
+            self.assertEqual(store.get("urn:a"), "fp1")
+
+    def test_same_stem_notes_keep_separate_rows(self):
+        # a/note.md and b/note.md map to the same dataset URN but are tracked separately
+        with StateStore(self.db, gms="http://gms-a:8080") as store:
+            store.put("/vault/a/note.md", "fp-a")
+            store.put("/vault/b/note.md", "fp-b")
+            self.assertEqual(store.get("/vault/a/note.md"), "fp-a")
+            self.assertEqual(store.get("/vault/b/note.md"), "fp-b")
+
+    def test_put_replaces_fingerprint(self):
+        with StateStore(self.db, gms="http://gms-a:8080", commit_every=1) as store:
+            store.put("urn:a", "fp1")
+            store.put("urn:a", "fp2")
+            self.assertEqual(store.get("urn:a"), "fp2")
+
+
+if __name__ == '__main__':
+    unittest.main()